@@ -0,0 +1,30 @@
+# Export the trained Random Forest to ONNX for the onnxruntime backend
+#
+# Usage (requires skl2onnx):
+#   python export_onnx.py
+# then start the API with MODEL_BACKEND=onnx
+import joblib
+from pathlib import Path
+from skl2onnx import convert_sklearn
+from skl2onnx.common.data_types import FloatTensorType
+
+def export_model():
+    """Convert dist/random_forest_model.pkl to dist/random_forest_model.onnx"""
+    current_dir = Path(__file__).parent
+    model_path = current_dir / "dist/random_forest_model.pkl"
+    onnx_path = current_dir / "dist/random_forest_model.onnx"
+
+    model = joblib.load(model_path)
+
+    # Disable zipmap so probabilities come back as a plain float tensor
+    onnx_model = convert_sklearn(
+        model,
+        initial_types=[("X", FloatTensorType([None, model.n_features_in_]))],
+        options={id(model): {"zipmap": False}},
+    )
+
+    onnx_path.write_bytes(onnx_model.SerializeToString())
+    print(f"ONNX model saved to {onnx_path}")
+
+if __name__ == "__main__":
+    export_model()
@@ -0,0 +1,31 @@
+# Compile the trained Random Forest to a shared library for the treelite backend
+#
+# Usage (requires treelite, tl2cgen and a C compiler):
+#   python export_treelite.py
+# then start the API with MODEL_BACKEND=treelite
+import joblib
+import treelite
+import tl2cgen
+from pathlib import Path
+
+def export_model():
+    """Compile dist/random_forest_model.pkl to dist/random_forest_model.so"""
+    current_dir = Path(__file__).parent
+    model_path = current_dir / "dist/random_forest_model.pkl"
+    lib_path = current_dir / "dist/random_forest_model.so"
+
+    model = joblib.load(model_path)
+    treelite_model = treelite.sklearn.import_model(model)
+
+    # quantize stores split thresholds as integer indices into a per-feature
+    # table, shrinking the node data walked at predict time
+    tl2cgen.export_lib(
+        treelite_model,
+        toolchain="gcc",
+        libpath=str(lib_path),
+        params={"quantize": 1, "parallel_comp": 8},
+    )
+    print(f"Compiled model saved to {lib_path}")
+
+if __name__ == "__main__":
+    export_model()
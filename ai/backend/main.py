@@ -1,16 +1,41 @@
 # Deployment script for FastAPI application
+import os
+
+# Keep native thread pools (OpenMP/BLAS) single-threaded. Concurrency comes from
+# the request threadpool and server workers, and nested pools in every worker
+# oversubscribe the CPUs. Must be set before numpy/sklearn are imported.
+for _var in ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS"):
+    os.environ.setdefault(_var, "1")
+
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.responses import ORJSONResponse
+from starlette.concurrency import run_in_threadpool
+from pydantic import BaseModel, ConfigDict, Field
 from contextlib import asynccontextmanager
+import asyncio
+import anyio.to_thread
+import functools
+import gc
+import itertools
+import operator
+import struct
 import joblib
 import numpy as np
-import pandas as pd
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Optional
 import logging
-import os
 from pathlib import Path
 
+try:
+    import onnxruntime as ort
+except ImportError:
+    ort = None
+
+try:
+    import tl2cgen
+except ImportError:
+    tl2cgen = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -20,9 +45,94 @@ model = None
 soil_encoder = None
 crop_encoder = None
 
+# Inference backend: "sklearn" runs the joblib model directly, "onnx" runs the
+# exported dist/random_forest_model.onnx through onnxruntime and "treelite"
+# runs the compiled dist/random_forest_model.so through tl2cgen
+MODEL_BACKEND = os.getenv("MODEL_BACKEND", "sklearn").lower()
+active_backend = None
+onnx_session = None
+treelite_predictor = None
+
+# Size of the threadpool that sync endpoints (the CPU-bound predictions) run in
+THREADPOOL_SIZE = int(os.getenv("THREADPOOL_SIZE", "64"))
+
+# Load the model at import time instead of in each worker's startup. Under a
+# pre-forking server (gunicorn --preload) workers then share the parent's model
+# pages copy-on-write instead of each holding a private copy.
+PRELOAD_MODELS = os.getenv("PRELOAD_MODELS", "").lower() in ("1", "true", "yes")
+
+# Number of chunks a /predict/batch matrix is split into and predicted on
+# concurrently. The default of 1 keeps the single fused call; raise it when a
+# worker has spare cores (e.g. one worker on a multi-core host); 0 or less is
+# treated as 1. Concurrent chunk predictions across all requests are bounded
+# by the CPU count.
+BATCH_PREDICT_THREADS = max(1, int(os.getenv("BATCH_PREDICT_THREADS", "1")))
+batch_predict_semaphore = asyncio.Semaphore(os.cpu_count() or 1)
+
+# Throwaway predictions run after loading, before serving traffic
+WARMUP_ROUNDS = 3
+
+# Number of distinct single-prediction inputs whose results are kept in memory
+PREDICTION_CACHE_SIZE = int(os.getenv("PREDICTION_CACHE_SIZE", "4096"))
+
+# Feature order the model was trained on
+FEATURE_COLUMNS = ['Soil_Type', 'Soil_pH', 'Temperature', 'Humidity',
+                   'Wind_Speed', 'N', 'P', 'K', 'Annual_Rainfall']
+
+# Reads the numeric SoilParameters fields in FEATURE_COLUMNS order (all but Soil_Type)
+get_numeric_features = operator.attrgetter(
+    'soil_ph', 'temperature', 'humidity', 'wind_speed', 'N', 'P', 'K', 'annual_rainfall'
+)
+
+# Packs one feature row into native float32 bytes, the layout of a
+# float32 row from new_feature_matrix() and the key of predict_features()
+pack_feature_row = struct.Struct(f"={len(FEATURE_COLUMNS)}f").pack
+
+# Lookup tables derived from the encoders, built once in load_models()
+SOIL_LUT: Dict[str, int] = {}
+VALID_SOIL_SET: frozenset = frozenset()
+VALID_SOIL_LIST: List[str] = []
+CROP_NAMES = None
+CROP_NAMES_LIST: List[str] = []
+
+# Prebuilt bodies for the read-only metadata endpoints
+CROPS_RESPONSE = None
+SOIL_TYPES_RESPONSE = None
+MODEL_INFO_RESPONSE = None
+
+def load_onnx_session(onnx_path: Path):
+    """Create an onnxruntime session for the exported forest, or None if unavailable"""
+    if ort is None:
+        logger.warning("onnxruntime is not installed, falling back to the sklearn backend")
+        return None
+    if not onnx_path.exists():
+        logger.warning(f"ONNX model not found at {onnx_path}, falling back to the sklearn backend")
+        return None
+    
+    sess_options = ort.SessionOptions()
+    sess_options.intra_op_num_threads = 1
+    sess_options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+    return ort.InferenceSession(
+        str(onnx_path), sess_options=sess_options, providers=["CPUExecutionProvider"]
+    )
+
+def load_treelite_predictor(lib_path: Path):
+    """Load the compiled forest library, or None if unavailable"""
+    if tl2cgen is None:
+        logger.warning("tl2cgen is not installed, falling back to the sklearn backend")
+        return None
+    if not lib_path.exists():
+        logger.warning(f"Compiled model not found at {lib_path}, falling back to the sklearn backend")
+        return None
+    
+    return tl2cgen.Predictor(str(lib_path), nthread=1)
+
 def load_models():
     """Load the trained model and encoders"""
-    global model, soil_encoder, crop_encoder
+    global model, soil_encoder, crop_encoder, SOIL_LUT, CROP_NAMES, CROP_NAMES_LIST
+    global VALID_SOIL_SET, VALID_SOIL_LIST
+    global active_backend, onnx_session, treelite_predictor
+    global CROPS_RESPONSE, SOIL_TYPES_RESPONSE, MODEL_INFO_RESPONSE
     
     try:
         current_dir = Path(__file__).parent
@@ -41,19 +151,198 @@ def load_models():
         soil_encoder = joblib.load(soil_encoder_path)
         crop_encoder = joblib.load(crop_encoder_path)
         
-        logger.info("Models and encoders loaded successfully")
+        # Predict in the calling thread instead of fanning out over joblib
+        # workers (the model was trained with n_jobs=-1)
+        if hasattr(model, 'n_jobs'):
+            model.n_jobs = 1
+        
+        # The model is fed plain arrays in FEATURE_COLUMNS order, so check the
+        # column names it was fitted with and drop them to avoid sklearn's
+        # "X does not have valid feature names" warning on every predict
+        if hasattr(model, 'feature_names_in_'):
+            fitted_columns = list(model.feature_names_in_)
+            if fitted_columns != FEATURE_COLUMNS:
+                raise ValueError(f"Model features {fitted_columns} do not match {FEATURE_COLUMNS}")
+            del model.feature_names_in_
+        
+        SOIL_LUT = {soil: i for i, soil in enumerate(soil_encoder.classes_)}
+        VALID_SOIL_SET = frozenset(SOIL_LUT)
+        VALID_SOIL_LIST = sorted(VALID_SOIL_SET)
+        CROP_NAMES = crop_encoder.classes_
+        CROP_NAMES_LIST = CROP_NAMES.tolist()
+        
+        # The sklearn model stays loaded for its metadata and as the fallback
+        onnx_session = None
+        treelite_predictor = None
+        active_backend = "sklearn"
+        if MODEL_BACKEND == "onnx":
+            onnx_session = load_onnx_session(current_dir / "dist/random_forest_model.onnx")
+            if onnx_session is not None:
+                active_backend = "onnx"
+        elif MODEL_BACKEND == "treelite":
+            treelite_predictor = load_treelite_predictor(current_dir / "dist/random_forest_model.so")
+            if treelite_predictor is not None:
+                active_backend = "treelite"
+        
+        CROPS_RESPONSE = {
+            "available_crops": sorted(CROP_NAMES_LIST),
+            "total_crops": len(CROP_NAMES_LIST)
+        }
+        SOIL_TYPES_RESPONSE = {
+            "available_soil_types": VALID_SOIL_LIST,
+            "total_soil_types": len(VALID_SOIL_LIST)
+        }
+        # Cached predictions belong to the previous model
+        predict_features.cache_clear()
+        
+        MODEL_INFO_RESPONSE = {
+            "model_type": type(model).__name__,
+            "features": FEATURE_COLUMNS,
+            "n_features": len(FEATURE_COLUMNS),
+            "backend": active_backend,
+        }
+        # Add additional info if available
+        if hasattr(model, 'n_estimators'):
+            MODEL_INFO_RESPONSE["n_estimators"] = model.n_estimators
+        if hasattr(model, 'max_depth'):
+            MODEL_INFO_RESPONSE["max_depth"] = model.max_depth
+        
+        # Run a few throwaway predictions so lazy allocations and thread pool
+        # setup in the backend happen now rather than on the first request
+        warmup_X = np.zeros((1, len(FEATURE_COLUMNS)), dtype=np.float32)
+        for _ in range(WARMUP_ROUNDS):
+            run_model(warmup_X)
+        
+        logger.info(f"Models and encoders loaded successfully ({active_backend} backend)")
         return True
         
     except Exception as e:
         logger.error(f"Error loading models: {str(e)}")
+        # Don't leave a partially loaded model behind: /health must report
+        # unhealthy and the endpoints must return 503
+        model = soil_encoder = crop_encoder = None
+        SOIL_LUT = {}
+        VALID_SOIL_SET = frozenset()
+        VALID_SOIL_LIST = []
+        CROP_NAMES = None
+        CROP_NAMES_LIST = []
+        CROPS_RESPONSE = SOIL_TYPES_RESPONSE = MODEL_INFO_RESPONSE = None
+        # A backend that fails warmup (e.g. a stale .onnx/.so) is dropped too
+        onnx_session = treelite_predictor = active_backend = None
         return False
 
+def new_feature_matrix(n_rows: int) -> np.ndarray:
+    """Allocate an uninitialised float32 feature matrix for n_rows samples.
+
+    Tree prediction descends each sample's row independently, so the matrix is
+    kept row-major (C order): every row's features sit next to each other in
+    memory. float32 matches the dtype sklearn's trees convert inputs to, which
+    avoids a copy inside predict.
+    """
+    return np.empty((n_rows, len(FEATURE_COLUMNS)), dtype=np.float32, order='C')
+
+def run_model(X: np.ndarray):
+    """
+    Run the active backend on a feature matrix.
+
+    Returns the encoded crop labels and the class probabilities (columns in
+    model.classes_ order), or None for the probabilities if the model has no
+    predict_proba. Labels are the argmax of the probabilities, as in the
+    forest's own predict, so the trees are only evaluated once.
+    """
+    if onnx_session is not None:
+        # Outputs are [label, probabilities]; zipmap is disabled at export
+        proba = onnx_session.run(None, {onnx_session.get_inputs()[0].name: X})[1]
+    elif treelite_predictor is not None:
+        # Output shape is (n_rows, n_targets, n_classes) with a single target
+        proba = treelite_predictor.predict(tl2cgen.DMatrix(X)).reshape(len(X), -1)
+    elif hasattr(model, 'predict_proba'):
+        proba = model.predict_proba(X)
+    else:
+        return model.predict(X), None
+    
+    return model.classes_[proba.argmax(axis=1)], proba
+
+async def run_model_chunked(X: np.ndarray):
+    """
+    Run the model on X split into up to BATCH_PREDICT_THREADS row chunks.
+
+    Chunks run concurrently in the threadpool (all backends release the GIL
+    while evaluating trees) and the results are stitched back in row order.
+    """
+    async def run_chunk(chunk: np.ndarray):
+        async with batch_predict_semaphore:
+            return await run_in_threadpool(run_model, chunk)
+    
+    chunks = np.array_split(X, min(BATCH_PREDICT_THREADS, len(X)))
+    results = await asyncio.gather(*(run_chunk(chunk) for chunk in chunks))
+    
+    predictions_encoded = np.concatenate([labels for labels, _ in results])
+    if results[0][1] is None:
+        return predictions_encoded, None
+    return predictions_encoded, np.concatenate([proba for _, proba in results])
+
+def build_feature_matrix(soil_params_list: List["SoilParameters"]) -> np.ndarray:
+    """
+    Assemble validated soil parameters into a feature matrix in training column order.
+
+    Fields are read with a C-level attrgetter and streamed into numpy with
+    fromiter, so no per-row numpy assignment or intermediate list of rows is
+    needed.
+    """
+    n_rows = len(soil_params_list)
+    X = new_feature_matrix(n_rows)
+    X[:, 0] = [SOIL_LUT[soil_params.soil_type] for soil_params in soil_params_list]
+    X[:, 1:] = np.fromiter(
+        itertools.chain.from_iterable(map(get_numeric_features, soil_params_list)),
+        dtype=np.float32,
+        count=n_rows * (len(FEATURE_COLUMNS) - 1)
+    ).reshape(n_rows, -1)
+    return X
+
+@functools.lru_cache(maxsize=PREDICTION_CACHE_SIZE)
+def predict_features(features: bytes):
+    """
+    Predict a single feature row given as the raw bytes of its float32 array.
+
+    The trees compare features at float32 precision, so inputs that map to the
+    same float32 row always get the same prediction and share a cache entry.
+    Returns (predicted_crop, confidence, probabilities); the probabilities
+    dict is shared between cache hits and must not be modified.
+    """
+    x = np.frombuffer(features, dtype=np.float32).reshape(1, -1)
+    predictions_encoded, proba = run_model(x)
+    predicted_crop = CROP_NAMES_LIST[predictions_encoded[0]]
+    
+    # Get prediction probabilities if available
+    probabilities = None
+    confidence = 1.0
+    
+    if proba is not None:
+        proba = proba[0]
+        confidence = float(np.max(proba))
+        
+        # Create probability dictionary sorted by probability. A stable
+        # argsort on the negated vector keeps ties in class order.
+        order = np.argsort(-proba, kind='stable').tolist()
+        proba_list = proba.tolist()
+        probabilities = {CROP_NAMES_LIST[i]: proba_list[i] for i in order}
+    
+    return predicted_crop, confidence, probabilities
+
+if PRELOAD_MODELS and load_models():
+    # Move everything loaded so far out of the collector's reach, so garbage
+    # collection in the forked workers doesn't write to (and un-share) its pages
+    gc.freeze()
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # Startup
-    success = load_models()
-    if not success:
-        logger.error("Failed to load models on startup")
+    anyio.to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    if model is None:
+        success = load_models()
+        if not success:
+            logger.error("Failed to load models on startup")
     yield
     # Shutdown (cleanup if needed)
 
@@ -64,6 +353,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -88,8 +378,9 @@ class SoilParameters(BaseModel):
     K: float = Field(..., description="Potassium content in soil", ge=0, le=500)
     annual_rainfall: float = Field(..., description="Annual rainfall in mm", ge=0, le=2000)
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        extra='forbid',
+        json_schema_extra={
             "example": {
                 "soil_type": "Clay",
                 "soil_ph": 6.5,
@@ -102,12 +393,13 @@ class SoilParameters(BaseModel):
                 "annual_rainfall": 200.0
             }
         }
+    )
 
 # Define the response model
 class CropRecommendation(BaseModel):
     predicted_crop: str
     confidence: float
-    input_parameters: Dict[str, Any]
+    input_parameters: SoilParameters
     all_probabilities: Optional[Dict[str, float]] = None
 
 class HealthCheck(BaseModel):
@@ -137,8 +429,17 @@ async def health_check():
         message="All models are loaded and ready"
     )
 
+# Model inference blocks, so it always runs in the threadpool: /predict is a
+# plain (sync) function that FastAPI dispatches there, and /predict/batch
+# awaits its chunk predictions there. Otherwise it would stall the event loop.
+# They return ORJSONResponse directly: response_model only documents the shape,
+# skipping FastAPI's validate-and-encode pass over the output.
+# The request is echoed through vars(soil_params): SoilParameters forbids extra
+# fields, so its __dict__ holds exactly the declared fields in order and is
+# serialised as-is instead of being copied with model_dump().
+
 @app.post("/predict", response_model=CropRecommendation)
-async def predict_crop(soil_params: SoilParameters):
+def predict_crop(soil_params: SoilParameters):
     """
     Predict the best crop based on soil and climate parameters
     """
@@ -148,56 +449,28 @@ async def predict_crop(soil_params: SoilParameters):
             detail="Models are not loaded. Please check the model files."
         )
     
+    if soil_params.soil_type not in VALID_SOIL_SET:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid soil type. Available types: {VALID_SOIL_LIST}"
+        )
+    
     try:
-        # Prepare the input data
-        new_data = {
-            "Soil_Type": soil_params.soil_type,
-            "Soil_pH": soil_params.soil_ph,
-            "Temperature": soil_params.temperature,
-            "Humidity": soil_params.humidity,
-            "Wind_Speed": soil_params.wind_speed,
-            "N": soil_params.N,
-            "P": soil_params.P,
-            "K": soil_params.K,
-            "Annual_Rainfall": soil_params.annual_rainfall
-        }
-        
-        # Convert to DataFrame
-        new_df = pd.DataFrame([new_data])
-        
-        # Encode Soil_Type
-        new_df["Soil_Type"] = soil_encoder.transform(new_df["Soil_Type"])
-        
-        # Reorder columns to match training data
-        new_df = new_df[['Soil_Type', 'Soil_pH', 'Temperature', 'Humidity',
-                         'Wind_Speed', 'N', 'P', 'K', 'Annual_Rainfall']]
-        
-        # Make prediction
-        prediction_encoded = model.predict(new_df)[0]
-        predicted_crop = crop_encoder.inverse_transform([prediction_encoded])[0]
+        # Pack the row in training column order straight into the float32
+        # bytes that key the cache (and are the model input on a miss)
+        features = pack_feature_row(
+            SOIL_LUT[soil_params.soil_type], *get_numeric_features(soil_params)
+        )
         
-        # Get prediction probabilities if available
-        probabilities = None
-        confidence = 1.0
+        # Make prediction (repeated inputs are served from the cache)
+        predicted_crop, confidence, probabilities = predict_features(features)
         
-        if hasattr(model, 'predict_proba'):
-            proba = model.predict_proba(new_df)[0]
-            confidence = float(np.max(proba))
-            
-            # Create probability dictionary
-            crop_names = crop_encoder.inverse_transform(range(len(proba)))
-            probabilities = {
-                crop: float(prob) for crop, prob in zip(crop_names, proba)
-            }
-            # Sort by probability
-            probabilities = dict(sorted(probabilities.items(), key=lambda x: x[1], reverse=True))
-        
-        return CropRecommendation(
-            predicted_crop=predicted_crop,
-            confidence=confidence,
-            input_parameters=soil_params.model_dump(),
-            all_probabilities=probabilities
-        )
+        return ORJSONResponse({
+            "predicted_crop": predicted_crop,
+            "confidence": confidence,
+            "input_parameters": vars(soil_params),
+            "all_probabilities": probabilities
+        })
         
     except Exception as e:
         logger.error(f"Prediction error: {str(e)}")
@@ -206,7 +479,7 @@ async def predict_crop(soil_params: SoilParameters):
             detail=f"Error making prediction: {str(e)}"
         )
 
-@app.post("/predict/batch")
+@app.post("/predict/batch", response_model=List[CropRecommendation])
 async def predict_crops_batch(soil_params_list: List[SoilParameters]):
     """
     Predict crops for multiple soil parameter sets
@@ -223,50 +496,37 @@ async def predict_crops_batch(soil_params_list: List[SoilParameters]):
             detail="Batch size too large. Maximum 100 predictions per request."
         )
     
+    invalid_soil_types = sorted({
+        soil_params.soil_type for soil_params in soil_params_list
+        if soil_params.soil_type not in VALID_SOIL_SET
+    })
+    if invalid_soil_types:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid soil type(s) {invalid_soil_types}. Available types: {VALID_SOIL_LIST}"
+        )
+    
+    if not soil_params_list:
+        return []
+    
     try:
-        predictions = []
+        X = build_feature_matrix(soil_params_list)
         
-        for soil_params in soil_params_list:
-            # Prepare the input data
-            new_data = {
-                "Soil_Type": soil_params.soil_type,
-                "Soil_pH": soil_params.soil_ph,
-                "Temperature": soil_params.temperature,
-                "Humidity": soil_params.humidity,
-                "Wind_Speed": soil_params.wind_speed,
-                "N": soil_params.N,
-                "P": soil_params.P,
-                "K": soil_params.K,
-                "Annual_Rainfall": soil_params.annual_rainfall
-            }
-            
-            # Convert to DataFrame
-            new_df = pd.DataFrame([new_data])
-            
-            # Encode Soil_Type
-            new_df["Soil_Type"] = soil_encoder.transform(new_df["Soil_Type"])
-            
-            # Reorder columns to match training data
-            new_df = new_df[['Soil_Type', 'Soil_pH', 'Temperature', 'Humidity',
-                             'Wind_Speed', 'N', 'P', 'K', 'Annual_Rainfall']]
-            
-            # Make prediction
-            prediction_encoded = model.predict(new_df)[0]
-            predicted_crop = crop_encoder.inverse_transform([prediction_encoded])[0]
-            
-            # Get confidence if available
-            confidence = 1.0
-            if hasattr(model, 'predict_proba'):
-                proba = model.predict_proba(new_df)[0]
-                confidence = float(np.max(proba))
-            
-            predictions.append(CropRecommendation(
-                predicted_crop=predicted_crop,
-                confidence=confidence,
-                input_parameters=soil_params.model_dump()
-            ))
+        # Predict the whole batch in a single call, or in concurrent chunks
+        # when BATCH_PREDICT_THREADS allows
+        predictions_encoded, proba = await run_model_chunked(X)
+        confidences = proba.max(axis=1) if proba is not None else np.ones(len(X))
         
-        return predictions
+        return ORJSONResponse([
+            {
+                "predicted_crop": CROP_NAMES_LIST[prediction_encoded],
+                "confidence": confidence,
+                "input_parameters": vars(soil_params),
+                "all_probabilities": None
+            }
+            for prediction_encoded, confidence, soil_params
+            in zip(predictions_encoded.tolist(), confidences.tolist(), soil_params_list)
+        ])
         
     except Exception as e:
         logger.error(f"Batch prediction error: {str(e)}")
@@ -275,86 +535,48 @@ async def predict_crops_batch(soil_params_list: List[SoilParameters]):
             detail=f"Error making batch predictions: {str(e)}"
         )
 
+# Model metadata never changes while the process runs, so these endpoints
+# return the responses prebuilt in load_models() and let clients cache them
+METADATA_CACHE_HEADERS = {"Cache-Control": "public, max-age=3600"}
+
 @app.get("/crops")
 async def get_available_crops():
     """
     Get list of all crops that the model can predict
     """
-    if crop_encoder is None:
+    if CROPS_RESPONSE is None:
         raise HTTPException(
             status_code=503,
             detail="Crop encoder is not loaded."
         )
     
-    try:
-        crops = crop_encoder.classes_.tolist()
-        return {
-            "available_crops": sorted(crops),
-            "total_crops": len(crops)
-        }
-    except Exception as e:
-        logger.error(f"Error getting crops: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving crop list: {str(e)}"
-        )
+    return ORJSONResponse(CROPS_RESPONSE, headers=METADATA_CACHE_HEADERS)
 
 @app.get("/soil-types")
 async def get_available_soil_types():
     """
     Get list of all soil types that the model can accept
     """
-    if soil_encoder is None:
+    if SOIL_TYPES_RESPONSE is None:
         raise HTTPException(
             status_code=503,
             detail="Soil encoder is not loaded."
         )
     
-    try:
-        soil_types = soil_encoder.classes_.tolist()
-        return {
-            "available_soil_types": sorted(soil_types),
-            "total_soil_types": len(soil_types)
-        }
-    except Exception as e:
-        logger.error(f"Error getting soil types: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving soil types list: {str(e)}"
-        )
+    return ORJSONResponse(SOIL_TYPES_RESPONSE, headers=METADATA_CACHE_HEADERS)
 
 @app.get("/model/info")
 async def get_model_info():
     """
     Get information about the loaded model
     """
-    if model is None:
+    if MODEL_INFO_RESPONSE is None:
         raise HTTPException(
             status_code=503,
             detail="Model is not loaded."
         )
     
-    try:
-        model_info = {
-            "model_type": type(model).__name__,
-            "features": ["Soil_Type", "Soil_pH", "Temperature", "Humidity", "Wind_Speed", "N", "P", "K", "Annual_Rainfall"],
-            "n_features": 9,
-        }
-        
-        # Add additional info if available
-        if hasattr(model, 'n_estimators'):
-            model_info["n_estimators"] = model.n_estimators
-        if hasattr(model, 'max_depth'):
-            model_info["max_depth"] = model.max_depth
-            
-        return model_info
-        
-    except Exception as e:
-        logger.error(f"Error getting model info: {str(e)}")
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error retrieving model information: {str(e)}"
-        )
+    return ORJSONResponse(MODEL_INFO_RESPONSE, headers=METADATA_CACHE_HEADERS)
 
 @app.post("/validate")
 async def validate_soil_parameters(soil_params: SoilParameters):
@@ -367,52 +589,16 @@ async def validate_soil_parameters(soil_params: SoilParameters):
             detail="Soil encoder is not loaded."
         )
     
-    try:
-        # Check if soil type is valid
-        available_soil_types = soil_encoder.classes_.tolist()
-        if soil_params.soil_type not in available_soil_types:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid soil type. Available types: {available_soil_types}"
-            )
-        
-        # Validate parameter ranges
-        validation_errors = []
-        
-        if not (0 <= soil_params.soil_ph <= 14):
-            validation_errors.append("Soil pH must be between 0 and 14")
-        if not (0 <= soil_params.temperature <= 50):
-            validation_errors.append("Temperature must be between 0 and 50°C")
-        if not (0 <= soil_params.humidity <= 100):
-            validation_errors.append("Humidity must be between 0 and 100%")
-        if not (0 <= soil_params.wind_speed <= 50):
-            validation_errors.append("Wind speed must be between 0 and 50 km/h")
-        if not (0 <= soil_params.N <= 200):
-            validation_errors.append("Nitrogen content must be between 0 and 200")
-        if not (0 <= soil_params.P <= 200):
-            validation_errors.append("Phosphorus content must be between 0 and 200")
-        if not (0 <= soil_params.K <= 200):
-            validation_errors.append("Potassium content must be between 0 and 200")
-        if not (0 <= soil_params.annual_rainfall <= 2000):
-            validation_errors.append("Annual rainfall must be between 0 and 2000 mm")
-        
-        if validation_errors:
-            raise HTTPException(
-                status_code=400,
-                detail={"validation_errors": validation_errors}
-            )
-        
-        return {
-            "status": "valid",
-            "message": "All parameters are valid",
-            "parameters": soil_params.model_dump()
-        }
-        
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Validation error: {str(e)}")
+    # Field ranges are already enforced by SoilParameters before this runs,
+    # so only the soil type needs checking against the encoder
+    if soil_params.soil_type not in VALID_SOIL_SET:
         raise HTTPException(
-            status_code=500,
-            detail=f"Error validating parameters: {str(e)}"
+            status_code=400,
+            detail=f"Invalid soil type. Available types: {VALID_SOIL_LIST}"
         )
+    
+    return {
+        "status": "valid",
+        "message": "All parameters are valid",
+        "parameters": soil_params.model_dump()
+    }